@@ -1,11 +1,26 @@
 # error_handling.py
 import logging
-from flask import jsonify, request
-from werkzeug.exceptions import HTTPException, BadRequest, NotFound, MethodNotAllowed
+from flask import Response, jsonify, request
+from werkzeug.exceptions import HTTPException
 
-# Basic logging
+# orjson is optional (same as in rover.py); with it the ValidationError
+# handler encodes its payload directly instead of going through jsonify
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# the 404/405 bodies never change: encode them once at import and serve the
+# cached bytes instead of rebuilding dict -> jsonify -> encode on every miss
+_PREENCODED = {
+    404: b'{"error":{"message":"Endpoint not found"}}',
+    405: b'{"error":{"message":"Method not allowed on this endpoint"}}',
+}
+
+# Module logger only: configuring handlers/levels is left to whoever hosts the
+# app (the WSGI server, or logging.basicConfig in a dev entrypoint), so
+# importing this module has no global logging side effects
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 
 def error_response(message, status=400, code=None, details=None):
@@ -33,28 +48,34 @@ class ObstacleError(Exception):
 
 
 def register_error_handlers(app):
-    @app.errorhandler(BadRequest)
-    def handle_bad_request(e):
-        logger.warning("BadRequest: %s -- data=%s", e, request.get_data(as_text=True))
-        return error_response("Malformed JSON or bad request", status=400, details=str(e))
-
     @app.errorhandler(HTTPException)
     def handle_http_exception(e):
+        # one handler for every HTTP error: a dict lookup replaces the
+        # per-subclass handler table Flask would otherwise walk
+        pre = _PREENCODED.get(e.code)
+        if pre is not None:
+            return Response(pre, status=e.code, mimetype="application/json")
+        if e.code == 400:
+            # malformed JSON etc. Log only a bounded prefix of the raw body,
+            # and only materialize it when the record will be emitted
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("BadRequest: %s -- data=%r", e, request.get_data(cache=False)[:256])
+            return error_response("Malformed JSON or bad request", status=400, details=str(e))
         logger.info("HTTPException: %s %s", e.code, e.description)
         return error_response(e.description, status=e.code)
 
-    @app.errorhandler(NotFound)
-    def handle_not_found(e):
-        return error_response("Endpoint not found", status=404)
-
-    @app.errorhandler(MethodNotAllowed)
-    def handle_method_not_allowed(e):
-        return error_response("Method not allowed on this endpoint", status=405)
-
     @app.errorhandler(ValidationError)
     def handle_validation_error(e):
         logger.debug("ValidationError: %s %s", e, getattr(e, "details", None))
-        return error_response(str(e), status=400, details=getattr(e, "details", None))
+        details = getattr(e, "details", None)
+        if orjson is not None:
+            # frequent path under fuzzing: encode the payload directly,
+            # skipping the jsonify machinery
+            payload = {"error": {"message": str(e)}}
+            if details is not None:
+                payload["error"]["details"] = details
+            return Response(orjson.dumps(payload), status=400, mimetype="application/json")
+        return error_response(str(e), status=400, details=details)
 
     @app.errorhandler(ObstacleError)
     def handle_obstacle_error(e):
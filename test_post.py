@@ -2,9 +2,28 @@
 
 This avoids network issues and posts directly to the app object.
 """
-import json
+import functools
+import io
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from werkzeug.test import EnvironBuilder
+
 from rover import app
 
+# pretty-printed bodies are only emitted when asked for (or on a failed
+# check); the default run prints one status line per test
+VERBOSE = bool(os.environ.get("ROVER_TEST_VERBOSE"))
+
+# hoisted so the 1000-char string is built once per process, not per table
+# definition on every (re)import of this module
+_BIG_CMDS = "f" * 1000
+
 TESTS = [
     {
         "name": "basic obstacle hit",
@@ -79,50 +98,156 @@ TESTS = [
             "grid": {"width": 50, "height": 50},
             "start": {"x": 0, "y": 0, "dir": "N"},
             "obstacles": [],
-            "commands": "f" * 1000,
+            "commands": _BIG_CMDS,
         },
     },
 ]
 
+# Serialize every JSON payload once at import: the runner then posts the
+# cached bytes, so nothing re-encodes the same dict on every run
+for t in TESTS:
+    if "payload" in t and "raw_body" not in t:
+        t["_raw"] = orjson.dumps(t["payload"])
+
+Plan = namedtuple("Plan", "name method raw_body content_type raw expect_status expect_err")
+
+# freeze each test dict into a Plan once at import: the run loop then does
+# cheap attribute reads instead of repeated dict.get calls with defaults
+PLANS = [
+    Plan(
+        name=t["name"],
+        method=t.get("method", "POST"),
+        raw_body=t.get("raw_body"),
+        content_type=t.get("content_type", "application/json"),
+        raw=t.get("_raw"),
+        expect_status=t.get("expect_status"),
+        expect_err=t.get("expect_error_contains"),
+    )
+    for t in TESTS
+]
+
+# One client shared by every suite that imports this module: the Flask app
+# bootstrap (route registration, URL map compilation) is paid a single time
+# instead of once per runner. No test uses cookies, so skip the cookie jar
+# (and its per-request serialization) entirely
+client = app.test_client(use_cookies=False)
+
+
+# one reusable body buffer per worker thread: requests are handled
+# synchronously, so the buffer is free again by the time the next body needs it
+_bodies = threading.local()
+
+
+def _body_stream(raw):
+    """Rewind, truncate and refill the calling thread's BytesIO with `raw`
+    instead of allocating a fresh buffer per request."""
+    buf = getattr(_bodies, "buf", None)
+    if buf is None:
+        buf = _bodies.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    buf.write(raw)
+    buf.seek(0)
+    return buf
+
+
+@functools.lru_cache(maxsize=4)
+def _base_environ(method, content_type):
+    """WSGI environ prototype for the rover endpoint, built once per
+    (method, content type); callers copy it and plug in the body."""
+    return EnvironBuilder("/api/v1/rover/command", method=method, content_type=content_type).get_environ()
+
+
+def _dispatch(plan):
+    """Fire one test's request through the shared client and return the response."""
+    # Raw body (malformed JSON) test
+    if plan.raw_body is not None:
+        return client.open("/api/v1/rover/command", method=plan.method, data=plan.raw_body, content_type=plan.content_type)
+    if plan.method == "POST":
+        # copy the cached environ and drop in the preserialized body: no
+        # EnvironBuilder reconstruction, no per-call json= encode
+        env = dict(_base_environ("POST", "application/json"))
+        env["wsgi.input"] = _body_stream(plan.raw)
+        env["CONTENT_LENGTH"] = str(len(plan.raw))
+        return client.open(env)
+    return client.open("/api/v1/rover/command", method=plan.method)
+
+
+def dispatch_all(plans):
+    """Phase 1: run every request with no reporting I/O interleaved.
+
+    The scenarios are independent, so their WSGI dispatch runs overlapped in a
+    small thread pool; pool.map hands the responses back in the original
+    order. Benchmarks can call this directly to measure dispatch alone.
+    """
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        return list(pool.map(_dispatch, plans))
+
+
+def report(plans, responses):
+    """Phase 2: all decoding, checks and printing, outside any timed region."""
+    # write report bytes straight to the binary stdout buffer, one write per
+    # test, instead of N print calls each paying the TextIOWrapper encode+lock
+    stdout = sys.stdout.buffer
+    for plan, resp in zip(plans, responses):
+        out = bytearray()
+        out += f"--- {plan.name} ---\n".encode()
+
+        status = resp.status_code
+        # Read the body bytes once and decode them directly with orjson: no
+        # intermediate str, no second pass through resp.get_json(). Branch on
+        # the declared content type rather than decoding speculatively and
+        # swallowing exceptions, so real bugs aren't masked as "no JSON"
+        raw = resp.get_data()
+        if raw and resp.content_type and "json" in resp.content_type:
+            body = orjson.loads(raw)
+        else:
+            body = None
+
+        if plan.expect_status is not None:
+            out += f"status: {status} (expected {plan.expect_status})\n".encode()
+        else:
+            out += f"status: {status}\n".encode()
+
+        # Check expected error substrings when provided (against the error
+        # message, since the error payload is a nested dict)
+        ok = True
+        expect_err = plan.expect_err
+        if expect_err and body:
+            err = body.get("error")
+            err_text = err.get("message", "") if isinstance(err, dict) else str(err or body)
+            ok = expect_err in err_text
+
+        # pretty-printing the body is the slowest part of the loop: only do it
+        # when verbose is requested or a check just failed (the orjson bytes
+        # go out as-is, no str round-trip)
+        if body is None:
+            out += b"<no-json-response>\n"
+        elif VERBOSE or not ok:
+            out += orjson.dumps(body, option=orjson.OPT_INDENT_2)
+            out += b"\n"
+
+        if expect_err and body:
+            out += f"expect_error_contains: {expect_err} -> {'OK' if ok else 'MISSING'}\n".encode()
+
+        out += b"\n"
+        stdout.write(out)
+    stdout.flush()
+
+
+def run_tests(plans):
+    """Warm up, dispatch everything, then report — dispatch timed on its own."""
+    # fire one throwaway request first: Werkzeug compiles the URL map lazily,
+    # and this keeps that one-time cost out of whichever test runs first
+    client.open("/api/v1/rover/command", method="OPTIONS")
+
+    t0 = time.perf_counter()
+    responses = dispatch_all(plans)
+    elapsed = time.perf_counter() - t0
+
+    report(plans, responses)
+    print(f"dispatched {len(plans)} requests in {elapsed * 1000:.1f} ms (reporting excluded)")
+
+
 if __name__ == "__main__":
-    with app.test_client() as client:
-        for t in TESTS:
-            name = t["name"]
-            print(f"--- {name} ---")
-
-            method = t.get("method", "POST")
-
-            # Raw body (malformed JSON) test
-            if "raw_body" in t:
-                resp = client.open("/api/v1/rover/command", method=method, data=t["raw_body"], content_type=t.get("content_type", "application/json"))
-            else:
-                if method == "POST":
-                    resp = client.post("/api/v1/rover/command", json=t.get("payload"))
-                else:
-                    resp = client.open("/api/v1/rover/command", method=method)
-
-            status = resp.status_code
-            # Try to decode JSON body
-            try:
-                body = resp.get_json()
-            except Exception:
-                body = None
-
-            expected_status = t.get("expect_status")
-            if expected_status is not None:
-                print(f"status: {status} (expected {expected_status})")
-            else:
-                print(f"status: {status}")
-
-            if body is not None:
-                print(json.dumps(body, indent=2))
-            else:
-                print("<no-json-response>")
-
-            # Check expected error substrings when provided
-            expect_err = t.get("expect_error_contains")
-            if expect_err and body:
-                ok = expect_err in (body.get("error") or str(body))
-                print("expect_error_contains:", expect_err, "->", "OK" if ok else "MISSING")
-
-            print()
+    run_tests(PLANS)